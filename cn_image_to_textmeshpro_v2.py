@@ -1,56 +1,276 @@
 import os
 import time
 import sys
+import json
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
 from PIL import Image
 import numpy as np
 from fractions import Fraction
 from tqdm import tqdm
 
 
-def image_to_textmeshpro(image_path, output_path, include_alpha, font_size):
-    img = Image.open(image_path).convert("RGBA")
-    width, height = img.size
-    data = np.array(img)
-
-    hex_colors = []
-    with tqdm(total=height, desc=f"[PROGRESS] 转换 {os.path.basename(image_path)}", ncols=100) as pbar:
-        for y in range(height):
-            current_color = None
-            count = 0
-            for x in range(width):
-                r, g, b, a = data[y, x]
-                if a > 0:
-                    if include_alpha:
-                        hex_color = f"#{r:02X}{g:02X}{b:02X}{a:02X}"
-                    else:
-                        hex_color = f"#{r:02X}{g:02X}{b:02X}"
-                    if hex_color == current_color:
-                        count += 1
+UNITY_TEXT_ASSET_HEADER = (
+    "%YAML 1.1\n"
+    "%TAG !u! tag:unity3d.com,2011:\n"
+    "--- !u!49 &4900000\n"
+    "TextAsset:\n"
+    "  m_ObjectHideFlags: 0\n"
+    "  m_CorrespondingSourceObject: {{fileID: 0}}\n"
+    "  m_PrefabInstance: {{fileID: 0}}\n"
+    "  m_PrefabAsset: {{fileID: 0}}\n"
+    "  m_Name: {name}\n"
+    "  m_Script: \""
+)
+
+INCREMENTAL_MAX_CHANGED_RATIO = 0.25
+FULL_BLOCK_BYTES_PER_PIXEL = 28
+HALF_BLOCK_BYTES_PER_PIXEL = 37
+UNITY_ASSET_EXTRA_BYTES_PER_PIXEL = 1
+WORKER_BASELINE_BYTES = 40 * 1024 * 1024
+DEFAULT_MEMORY_BUDGET_MB = 2048
+DEFAULT_FONT_LINE_HEIGHT = 1.2
+
+
+def pixel_to_hex(pixel, include_alpha):
+    r, g, b, a = pixel
+    if a == 0:
+        return None
+    if include_alpha:
+        return f"#{r:02X}{g:02X}{b:02X}{a:02X}"
+    return f"#{r:02X}{g:02X}{b:02X}"
+
+
+def half_block_cell(top_color, bottom_color, current_mark):
+    if top_color is None and bottom_color is None:
+        return None
+    if bottom_color is None:
+        return None, top_color, "▀"
+    if top_color is None:
+        keep_mark = current_mark == bottom_color and (len(bottom_color) == 7 or bottom_color.endswith("FF"))
+        return (bottom_color if keep_mark else None), bottom_color, "▄"
+    if top_color == bottom_color and current_mark != bottom_color:
+        return None, top_color, "█"
+    return bottom_color, top_color, "▀"
+
+
+def half_block_mark_padding(font_line_height):
+    return f"0,0,{-font_line_height * 50:g},0"
+
+
+def encode_row(data, y, include_alpha, half_block, font_line_height=DEFAULT_FONT_LINE_HEIGHT):
+    height, width = data.shape[:2]
+    mark_padding = half_block_mark_padding(font_line_height)
+    cells = []
+    current_mark = None
+    current_run = None
+    count = 0
+    for x in range(width + 1):
+        cell = None
+        if x < width:
+            top_color = pixel_to_hex(data[y, x], include_alpha)
+            if half_block:
+                bottom_color = pixel_to_hex(data[y + 1, x], include_alpha) if y + 1 < height else None
+                cell = half_block_cell(top_color, bottom_color, current_mark)
+            elif top_color is not None:
+                cell = None, top_color, "█"
+        mark, run = (cell[0], cell[1:]) if cell is not None else (None, None)
+        if cell is not None and mark == current_mark and run == current_run:
+            count += 1
+            continue
+        if current_run is not None:
+            cells.append(f"<color={current_run[0]}>{current_run[1] * count}</color>")
+        if current_mark is not None and mark != current_mark:
+            cells.append("</mark>")
+        if mark is not None and mark != current_mark:
+            cells.append(f"<mark={mark} padding=\"{mark_padding}\">")
+        current_mark = mark
+        current_run = run
+        count = 1 if cell is not None else 0
+    cells.append("\\n")
+    return "".join(cells)
+
+
+def row_cache_path(output_path):
+    return os.path.join(os.path.dirname(output_path), ".rowcache", os.path.basename(output_path) + ".json")
+
+
+def load_row_cache(output_path, settings):
+    cache_path = row_cache_path(output_path)
+    if not os.path.exists(output_path) or not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "r", encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cache.get("settings") != settings or cache.get("output_size") != os.path.getsize(output_path):
+        return None
+    return cache
+
+
+def remove_row_cache(output_path):
+    cache_path = row_cache_path(output_path)
+    if os.path.exists(cache_path):
+        os.remove(cache_path)
+
+
+def save_row_cache(output_path, settings, row_hashes, row_offsets):
+    cache_path = row_cache_path(output_path)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    cache = {
+        "settings": settings,
+        "output_size": os.path.getsize(output_path),
+        "row_hashes": row_hashes,
+        "row_offsets": row_offsets,
+    }
+    with open(cache_path, "w", encoding='utf-8') as f:
+        json.dump(cache, f)
+
+
+def output_wrappers(output_path, font_size, unity_asset):
+    if not unity_asset:
+        return f"<size={font_size}>", "</size>"
+    name = os.path.splitext(os.path.basename(output_path))[0]
+    header = UNITY_TEXT_ASSET_HEADER.format(name=json.dumps(name, ensure_ascii=False))
+    return header + escape_yaml(f"<size={font_size}>"), escape_yaml("</size>") + "\"\n"
+
+
+def escape_yaml(text):
+    return json.dumps(text, ensure_ascii=False)[1:-1]
+
+
+def encode_output_row(data, y, include_alpha, half_block, unity_asset, font_line_height):
+    encoded_row = encode_row(data, y, include_alpha, half_block, font_line_height)
+    if unity_asset:
+        encoded_row = escape_yaml(encoded_row)
+    return encoded_row.encode("utf-8")
+
+
+def format_file_size(path):
+    output_size = os.path.getsize(path) / (1024 * 1024)
+    return f"{output_size:.2f} MB" if output_size >= 1 else f"{output_size * 1024:.2f} KB"
+
+
+def write_textmeshpro(data, output_path, include_alpha, font_size, half_block, desc, unity_asset=False,
+                      font_line_height=DEFAULT_FONT_LINE_HEIGHT, verbose=True):
+    height, width = data.shape[:2]
+    row_step = 2 if half_block else 1
+    rows = range(0, height, row_step)
+    settings = {"width": width, "height": height, "include_alpha": include_alpha, "font_size": font_size, "half_block": half_block,
+                "font_line_height": font_line_height}
+    row_hashes = [hashlib.blake2b(data[y:y + row_step].tobytes(), digest_size=16).hexdigest() for y in rows]
+
+    cache = load_row_cache(output_path, settings)
+    old_hashes = cache["row_hashes"] if cache else [None] * len(rows)
+    changed = [i for i, row_hash in enumerate(row_hashes) if row_hash != old_hashes[i]]
+    if cache and len(changed) > len(rows) * INCREMENTAL_MAX_CHANGED_RATIO:
+        cache = None
+    if cache and verbose:
+        print(f"\033[94m[INFO] {os.path.basename(output_path)}: {len(rows)} 行中有 {len(rows) - len(changed)} 行未改动，重新编码 {len(changed)} 行\033[0m")
+
+    encoded_rows = {}
+    with tqdm(total=len(rows) if cache is None else len(changed), desc=desc, ncols=100, disable=not verbose) as pbar:
+        if cache is None:
+            remove_row_cache(output_path)
+            header, footer = output_wrappers(output_path, font_size, unity_asset)
+            row_offsets = []
+            with open(output_path, "wb") as f:
+                f.write(header.encode("utf-8"))
+                for y in rows:
+                    row_offsets.append(f.tell())
+                    f.write(encode_output_row(data, y, include_alpha, half_block, unity_asset, font_line_height))
+                    pbar.update(1)
+                row_offsets.append(f.tell())
+                f.write(footer.encode("utf-8"))
+        else:
+            for i in changed:
+                encoded_rows[i] = encode_output_row(data, rows[i], include_alpha, half_block, unity_asset, font_line_height)
+                pbar.update(1)
+
+    if cache is not None:
+        remove_row_cache(output_path)
+        old_offsets = cache["row_offsets"]
+        if all(len(encoded_rows[i]) == old_offsets[i + 1] - old_offsets[i] for i in changed):
+            row_offsets = old_offsets
+            with open(output_path, "r+b") as f:
+                for i in changed:
+                    f.seek(row_offsets[i])
+                    f.write(encoded_rows[i])
+        else:
+            row_offsets = []
+            temp_path = output_path + ".tmp"
+            with open(output_path, "rb") as old_file, open(temp_path, "wb") as f:
+                f.write(old_file.read(old_offsets[0]))
+                for i in range(len(rows)):
+                    row_offsets.append(f.tell())
+                    if i in encoded_rows:
+                        f.write(encoded_rows[i])
                     else:
-                        if current_color is not None:
-                            hex_colors.append(f"<color={current_color}>{'█' * count}</color>")
-                        current_color = hex_color
-                        count = 1
-                else:
-                    if current_color is not None:
-                        hex_colors.append(f"<color={current_color}>{'█' * count}</color>")
-                        current_color = None
-                        count = 0
-            if current_color is not None:
-                hex_colors.append(f"<color={current_color}>{'█' * count}</color>")
-            hex_colors.append("\\n")
-            pbar.update(1)
-    output_content = f"<size={font_size}>" + "".join(hex_colors).replace("\n", "\\n") + "</size>"
-
-    with open(output_path, "w", encoding='utf-8') as f:
-        f.write(output_content)
-
-    output_size = os.path.getsize(output_path) / (1024 * 1024)
-    output_size_str = f"{output_size:.2f} MB" if output_size >= 1 else f"{output_size * 1024:.2f} KB"
+                        old_file.seek(old_offsets[i])
+                        f.write(old_file.read(old_offsets[i + 1] - old_offsets[i]))
+                row_offsets.append(f.tell())
+                old_file.seek(old_offsets[-1])
+                f.write(old_file.read())
+            os.replace(temp_path, output_path)
+
+    save_row_cache(output_path, settings, row_hashes, row_offsets)
+    return format_file_size(output_path)
+
+
+def lod_output_path(output_path, level):
+    if level == 0:
+        return output_path
+    base, ext = os.path.splitext(output_path)
+    return f"{base}_lod{level}{ext}"
+
 
+def count_lod_levels(width, height):
+    levels = 1
+    while width > 1 or height > 1:
+        width, height = (width + 1) // 2, (height + 1) // 2
+        levels += 1
+    return levels
+
+
+def image_to_textmeshpro(image_path, output_path, include_alpha, font_size, half_block=False, lod_levels=1, unity_asset=False,
+                         font_line_height=DEFAULT_FONT_LINE_HEIGHT, verbose=True):
+    img = Image.open(image_path).convert("RGBA")
+    image_name = os.path.basename(image_path)
+
+    max_lod_levels = count_lod_levels(*img.size)
+    if lod_levels > max_lod_levels:
+        if verbose:
+            print(f"\033[93m[WARNING] {image_name} 的分辨率为 {img.width}x{img.height} Pix，LOD {max_lod_levels - 1} 即为 1x1，将输出 {max_lod_levels} 级而非 {lod_levels} 级\033[0m")
+        lod_levels = max_lod_levels
+
+    premultiplied = img.convert("RGBa") if lod_levels > 1 else None
+    results = []
+    for level in range(lod_levels):
+        if level == 0:
+            data = np.array(img)
+        else:
+            premultiplied = premultiplied.reduce(2)
+            data = np.array(premultiplied.convert("RGBA"))
+        level_height, level_width = data.shape[:2]
+        desc = f"[PROGRESS] 转换 {image_name}" if level == 0 else f"[PROGRESS] 转换 {image_name} LOD {level}"
+        level_path = lod_output_path(output_path, level)
+        output_size_str = write_textmeshpro(data, level_path, include_alpha, font_size, half_block, desc, unity_asset, font_line_height, verbose)
+        results.append((level, level_width, level_height, output_size_str, level_path))
+
+    if not verbose:
+        return results
     print(f"\033[92m[SUCCESS] 转换成功！\033[0m")
-    print(f"\033[92m[SUCCESS] 输出文件大小: {output_size_str}\033[0m")
-    print(f"\033[92m[SUCCESS] 输出文件路径: {os.path.abspath(output_path)}\033[0m")
+    if lod_levels == 1:
+        print(f"\033[92m[SUCCESS] 输出文件大小: {results[0][3]}\033[0m")
+        print(f"\033[92m[SUCCESS] 输出文件路径: {os.path.abspath(output_path)}\033[0m")
+        return results
+    for level, level_width, level_height, output_size_str, level_path in results:
+        print(f"\033[92m[SUCCESS] LOD {level}（1/{2 ** level}，{level_width}x{level_height} Pix）输出文件大小: {output_size_str} | {os.path.abspath(level_path)}\033[0m")
+
+    return results
 
 
 def parse_font_size(input_size):
@@ -83,14 +303,150 @@ def get_color_mode(image_path):
         return "RGBA" if 'A' in bands else "RGB"
 
 
+def ask_conversion_settings():
+    while True:
+        include_alpha = input(
+            "\033[96m[INPUT] 是否包含透明度通道? (Yes/No): \033[0m").strip().lower()
+        if include_alpha in ['yes', 'y']:
+            include_alpha = True
+            break
+        elif include_alpha in ['no', 'n']:
+            include_alpha = False
+            break
+        else:
+            print("\033[91m[ERROR] 输入无效，请输入 'Yes' 或 'No'。\033[0m")
+
+    while True:
+        half_block = input(
+            "\033[96m[INPUT] 是否使用半块模式（每行文本包含两行像素）? (Yes/No): \033[0m").strip().lower()
+        if half_block in ['yes', 'y']:
+            half_block = True
+            break
+        elif half_block in ['no', 'n']:
+            half_block = False
+            break
+        else:
+            print("\033[91m[ERROR] 输入无效，请输入 'Yes' 或 'No'。\033[0m")
+
+    font_line_height = DEFAULT_FONT_LINE_HEIGHT
+    while half_block:
+        font_line_height = input(f"\033[96m[INPUT] 请设置字体行高（单位 em），即TMP字体资源 Face Info 中的 (Ascent Line - Descent Line) / Point Size (默认为 {DEFAULT_FONT_LINE_HEIGHT}): \033[0m").strip() or str(DEFAULT_FONT_LINE_HEIGHT)
+        try:
+            font_line_height = float(font_line_height)
+        except ValueError:
+            font_line_height = 0
+        if font_line_height > 0:
+            break
+        print("\033[91m[ERROR] 行高无效，请输入正数。\033[0m")
+
+    while True:
+        font_size = input("\033[96m[INPUT] 请设置像素大小，支持整数/浮点数/百分数/分数 (默认为 1): \033[0m").strip()
+        try:
+            font_size = parse_font_size(font_size)
+            break
+        except ValueError:
+            print("\033[91m[ERROR] 字体大小格式错误，请重新输入。\033[0m")
+
+    while True:
+        lod_levels = input("\033[96m[INPUT] 请设置LOD层级数 (1 为仅输出原始尺寸，默认为 1): \033[0m").strip() or '1'
+        try:
+            lod_levels = int(lod_levels)
+        except ValueError:
+            lod_levels = 0
+        if lod_levels >= 1:
+            break
+        print("\033[91m[ERROR] LOD层级数无效，请输入不小于 1 的整数。\033[0m")
+
+    while True:
+        unity_asset = input(
+            "\033[96m[INPUT] 是否输出为Unity TextAsset (.asset) 文件而非 .txt 文件? (Yes/No): \033[0m").strip().lower()
+        if unity_asset in ['yes', 'y']:
+            unity_asset = True
+            break
+        elif unity_asset in ['no', 'n']:
+            unity_asset = False
+            break
+        else:
+            print("\033[91m[ERROR] 输入无效，请输入 'Yes' 或 'No'。\033[0m")
+
+    return include_alpha, half_block, font_size, lod_levels, unity_asset, font_line_height
+
+
+def format_memory(size):
+    return f"{size / (1024 * 1024):.2f} MB"
+
+
+def estimate_job_memory(width, height, lod_levels, half_block, unity_asset):
+    pixel_count = width * height
+    encoded_bytes_per_pixel = HALF_BLOCK_BYTES_PER_PIXEL if half_block else FULL_BLOCK_BYTES_PER_PIXEL
+    if unity_asset:
+        encoded_bytes_per_pixel += UNITY_ASSET_EXTRA_BYTES_PER_PIXEL
+    estimate = WORKER_BASELINE_BYTES + pixel_count * 4 * 3
+    if lod_levels > 1:
+        estimate += pixel_count * 4 * 2
+    estimate += int(pixel_count * encoded_bytes_per_pixel * INCREMENTAL_MAX_CHANGED_RATIO)
+    estimate += height * 256
+    return estimate
+
+
+def run_batch(jobs, memory_budget, conversion_kwargs, max_workers):
+    pending = sorted(jobs, key=lambda job: job[2], reverse=True)
+    running = {}
+    memory_in_use = 0
+    peak_memory = 0
+    peak_concurrency = 0
+    failed = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            for job in list(pending):
+                if len(running) >= max_workers:
+                    break
+                if running and memory_in_use + job[2] > memory_budget:
+                    continue
+                if job[2] > memory_budget:
+                    print(f"\033[93m[WARNING] {os.path.basename(job[0])} 预计需要 {format_memory(job[2])} 内存，超出内存预算，将单独运行\033[0m")
+                pending.remove(job)
+                try:
+                    future = executor.submit(image_to_textmeshpro, job[0], job[1], verbose=False, **conversion_kwargs)
+                except BrokenProcessPool:
+                    print(f"\033[91m[ERROR] 工作进程意外终止（可能是内存不足），以下图片未开始转换: {', '.join(os.path.basename(not_started[0]) for not_started in [job] + pending)}\033[0m")
+                    failed.extend([job] + pending)
+                    pending = []
+                    break
+                running[future] = job
+                memory_in_use += job[2]
+            peak_memory = max(peak_memory, memory_in_use)
+            peak_concurrency = max(peak_concurrency, len(running))
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = running.pop(future)
+                memory_in_use -= job[2]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    print(f"\033[91m[ERROR] 图片处理失败: {os.path.basename(job[0])}: {e}\033[0m")
+                    failed.append(job)
+                    continue
+                for level, level_width, level_height, output_size_str, level_path in results:
+                    print(f"\033[92m[SUCCESS] {os.path.basename(job[0])}: LOD {level}（{level_width}x{level_height} Pix）输出文件大小: {output_size_str} | {os.path.abspath(level_path)}\033[0m")
+                if len(results) < conversion_kwargs["lod_levels"]:
+                    print(f"\033[93m[WARNING] {os.path.basename(job[0])} 在 LOD {len(results) - 1} 即为 1x1，已输出 {len(results)} 级而非 {conversion_kwargs['lod_levels']} 级\033[0m")
+    return peak_concurrency, peak_memory, failed
+
+
 def show_example_usage():
     print("=" * 100)
 
     print("\033[94m[INFO] 基本操作：\033[0m")
-    print("1. 选择输入图像（支持PNG、JPG、JPEG等常见的位图格式）")
+    print("1. 选择输入图像（支持PNG、JPG、JPEG等常见的位图格式），输入以逗号分隔的多个编号或 'all' 可批量转换")
     print("2. 选择是否包含透明度通道")
-    print("3. 设置字体大小，支持整数、浮点数、百分数、分数")
-    print("4. 转换为TMP富文本标签")
+    print("3. 选择是否使用半块模式（每行文本包含两行像素，下方像素颜色重复较多时输出更小）")
+    print("   半块模式还需要设置字体行高，可在TMP字体资源的 Face Info 中查看")
+    print("4. 设置字体大小，支持整数、浮点数、百分数、分数")
+    print("5. 设置LOD层级数，每增加一级会额外输出一份分辨率减半的结果")
+    print("6. 选择是否输出为Unity TextAsset (.asset) 文件而非 .txt 文件")
+    print("7. 转换为TMP富文本标签")
 
     print("\033[94m[INFO] 像素大小设置示例：\033[0m")
     print("像素大小可以是：")
@@ -99,6 +455,14 @@ def show_example_usage():
     print(" - 百分数（例如：50%）")
     print(" - 分数（例如：2/3）")
 
+    print("\033[94m[INFO] 半块模式字体行高说明：\033[0m")
+    print("下方像素由 <mark> 标记绘制，TMP会将其绘制在字符之上，范围为字体的 Descent Line 到 Ascent Line。")
+    print("标记的上边距会被设为负的半个行高，使其只覆盖该行的下半部分。")
+    print(" - 行高 = (Ascent Line - Descent Line) / Point Size，数值来自TMP字体资源的 Face Info")
+    print(f" - 大多数字体约为 1.1 到 1.2，默认为 {DEFAULT_FONT_LINE_HEIGHT}")
+    print(" - 假定字体的方块字符（█ ▀ ▄）从 Descent Line 填满到 Ascent Line")
+    print(" - 数值偏小会使标记遮住上方像素，数值偏大会在上下像素之间留下空隙")
+
     print("\033[94m[INFO] 转换后生成的TMP富文本标签示例：\033[0m")
     example_text = """
     - 不带有透明度通道
@@ -106,6 +470,9 @@ def show_example_usage():
 
     - 带有透明度通道
     <size=1><color=#FF0000FF>█████</color><color=#00FF0080>████████</color><color=#0000FF00>██████████</color></size>
+
+    - 半块模式，行高 1.2（上方像素为文本颜色，下方像素为覆盖下半部分的标记颜色）
+    <size=1><mark=#0000FF padding="0,0,-60,0"><color=#FF0000>▀▀▀▀▀</color><color=#FFFF00>▀▀▀</color></mark><color=#00FF00>▄▄▄▄</color><color=#FFFFFF>████</color></size>
     """
     print(example_text)
 
@@ -113,6 +480,8 @@ def show_example_usage():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
     print("\033[97m[WELCOME] 欢迎使用图片转TMP富文本标签工具！\033[0m")
     print("\033[97m[WELCOME] 本工具可以将指定格式的图片转换为适用于Unity引擎的TMP富文本标签!\033[0m")
     print("\033[97m[WELCOME] 作者: www.bilibili.com@是闪闪闪闪闪\033[0m")
@@ -171,7 +540,7 @@ if __name__ == "__main__":
             print_dynamic_line(100)
 
             while True:
-                user_input = input("\033[96m[INPUT] 请输入相应的图片编号进行选择或输入 '0' 退出: \033[0m")
+                user_input = input("\033[96m[INPUT] 请输入相应的图片编号进行选择，输入以逗号分隔的多个编号或 'all' 批量转换，或输入 '0' 退出: \033[0m")
                 if user_input == '0':
                     print("\033[92m[SUCCESS] 已退出进程。\033[0m")
                     print("当前窗口将在5秒后关闭...")
@@ -179,6 +548,66 @@ if __name__ == "__main__":
                     sys.exit()
 
                 try:
+                    if user_input.strip().lower() == 'all' or ',' in user_input:
+                        if user_input.strip().lower() == 'all':
+                            choices = list(range(len(images)))
+                        else:
+                            choices = sorted({int(part) - 1 for part in user_input.split(',') if part.strip()})
+                        if not choices or not all(0 <= choice < len(images) for choice in choices):
+                            print("\033[91m[ERROR] 无效的输入，请输入有效的图片编号！\033[0m")
+                            continue
+
+                        try:
+                            include_alpha, half_block, font_size, lod_levels, unity_asset, font_line_height = ask_conversion_settings()
+
+                            while True:
+                                memory_budget = input(f"\033[96m[INPUT] 请设置批量转换的内存预算，单位 MB (默认为 {DEFAULT_MEMORY_BUDGET_MB}): \033[0m").strip() or str(DEFAULT_MEMORY_BUDGET_MB)
+                                try:
+                                    memory_budget = int(memory_budget)
+                                except ValueError:
+                                    memory_budget = 0
+                                if memory_budget > 0:
+                                    memory_budget *= 1024 * 1024
+                                    break
+                                print("\033[91m[ERROR] 内存预算无效，请输入正整数。\033[0m")
+
+                            jobs = []
+                            output_owners = {}
+                            for choice in choices:
+                                selected_image = os.path.join(input_folder, images[choice])
+                                img_width, img_height = Image.open(selected_image).size
+                                output_file_name = f"{os.path.splitext(images[choice])[0]}{'.asset' if unity_asset else '.txt'}"
+                                output_path = os.path.join(output_folder, output_file_name)
+                                job_outputs = [os.path.normcase(lod_output_path(output_path, level))
+                                               for level in range(min(lod_levels, count_lod_levels(img_width, img_height)))]
+                                conflict = next((output_owners[path] for path in job_outputs if path in output_owners), None)
+                                if conflict is not None:
+                                    print(f"\033[91m[ERROR] {images[choice]} 的输出会覆盖 {conflict} 的输出，已跳过。请重命名其中一张图片后再转换。\033[0m")
+                                    continue
+                                output_owners.update((path, images[choice]) for path in job_outputs)
+                                jobs.append((selected_image, output_path, estimate_job_memory(img_width, img_height, lod_levels, half_block, unity_asset)))
+
+                            max_workers = min(os.cpu_count() or 1, len(jobs), max(1, memory_budget // WORKER_BASELINE_BYTES))
+                            print(f"\033[94m[INFO] 使用最多 {max_workers} 个进程转换 {len(jobs)} 张图片，按体积从大到小调度（预计内存: {', '.join(f'{os.path.basename(job[0])} {format_memory(job[2])}' for job in jobs)}）\033[0m")
+                            start_time = time.time()
+                            conversion_kwargs = {"include_alpha": include_alpha, "font_size": font_size, "half_block": half_block,
+                                                 "lod_levels": lod_levels, "unity_asset": unity_asset, "font_line_height": font_line_height}
+                            peak_concurrency, peak_memory, failed = run_batch(jobs, memory_budget, conversion_kwargs, max_workers)
+                            print(f"\033[92m[SUCCESS] 批量转换完成: {len(choices)} 张图片中成功 {len(jobs) - len(failed)} 张，用时 {time.time() - start_time:.2f} 秒\033[0m")
+                            print(f"\033[92m[SUCCESS] 最大并发数: {peak_concurrency} / {max_workers} 个进程 | 预计内存峰值: {format_memory(peak_memory)} / 预算 {format_memory(memory_budget)}\033[0m")
+
+                        except Exception as e:
+                            print(f"\033[91m[ERROR] 图片处理失败: {e}\033[0m")
+
+                        continue_conversion = input(
+                            "\033[96m[INPUT] 是否继续转换其他图片? (Yes/No): \033[0m").strip().lower()
+                        if continue_conversion not in ['yes', 'y']:
+                            print("\033[92m[SUCCESS] 已退出进程。\033[0m")
+                            print("当前窗口将在5秒后关闭...")
+                            time.sleep(5)
+                            sys.exit()
+                        break
+
                     choice = int(user_input) - 1
                     if 0 <= choice < len(images):
                         selected_image = os.path.join(input_folder, images[choice])
@@ -200,29 +629,11 @@ if __name__ == "__main__":
                                 if confirm not in ['yes', 'y']:
                                     continue
 
-                            while True:
-                                include_alpha = input(
-                                    "\033[96m[INPUT] 是否包含透明度通道? (Yes/No): \033[0m").strip().lower()
-                                if include_alpha in ['yes', 'y']:
-                                    include_alpha = True
-                                    break
-                                elif include_alpha in ['no', 'n']:
-                                    include_alpha = False
-                                    break
-                                else:
-                                    print("\033[91m[ERROR] 输入无效，请输入 'Yes' 或 'No'。\033[0m")
-
-                            while True:
-                                font_size = input("\033[96m[INPUT] 请设置像素大小，支持整数/浮点数/百分数/分数 (默认为 1): \033[0m").strip()
-                                try:
-                                    font_size = parse_font_size(font_size)
-                                    break
-                                except ValueError:
-                                    print("\033[91m[ERROR] 字体大小格式错误，请重新输入。\033[0m")
+                            include_alpha, half_block, font_size, lod_levels, unity_asset, font_line_height = ask_conversion_settings()
 
-                            output_file_name = f"{os.path.splitext(images[choice])[0]}.txt"
+                            output_file_name = f"{os.path.splitext(images[choice])[0]}{'.asset' if unity_asset else '.txt'}"
                             output_path = os.path.join(output_folder, output_file_name)
-                            image_to_textmeshpro(selected_image, output_path, include_alpha, font_size)
+                            image_to_textmeshpro(selected_image, output_path, include_alpha, font_size, half_block, lod_levels, unity_asset, font_line_height)
 
                         except Exception as e:
                             print(f"\033[91m[ERROR] 图片处理失败: {e}\033[0m")
@@ -1,56 +1,276 @@
 import os
 import time
 import sys
+import json
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
 from PIL import Image
 import numpy as np
 from fractions import Fraction
 from tqdm import tqdm
 
 
-def image_to_textmeshpro(image_path, output_path, include_alpha, font_size):
-    img = Image.open(image_path).convert("RGBA")
-    width, height = img.size
-    data = np.array(img)
-
-    hex_colors = []
-    with tqdm(total=height, desc=f"[PROGRESS] Converting {os.path.basename(image_path)}", ncols=100) as pbar:
-        for y in range(height):
-            current_color = None
-            count = 0
-            for x in range(width):
-                r, g, b, a = data[y, x]
-                if a > 0:
-                    if include_alpha:
-                        hex_color = f"#{r:02X}{g:02X}{b:02X}{a:02X}"
-                    else:
-                        hex_color = f"#{r:02X}{g:02X}{b:02X}"
-                    if hex_color == current_color:
-                        count += 1
+UNITY_TEXT_ASSET_HEADER = (
+    "%YAML 1.1\n"
+    "%TAG !u! tag:unity3d.com,2011:\n"
+    "--- !u!49 &4900000\n"
+    "TextAsset:\n"
+    "  m_ObjectHideFlags: 0\n"
+    "  m_CorrespondingSourceObject: {{fileID: 0}}\n"
+    "  m_PrefabInstance: {{fileID: 0}}\n"
+    "  m_PrefabAsset: {{fileID: 0}}\n"
+    "  m_Name: {name}\n"
+    "  m_Script: \""
+)
+
+INCREMENTAL_MAX_CHANGED_RATIO = 0.25
+FULL_BLOCK_BYTES_PER_PIXEL = 28
+HALF_BLOCK_BYTES_PER_PIXEL = 37
+UNITY_ASSET_EXTRA_BYTES_PER_PIXEL = 1
+WORKER_BASELINE_BYTES = 40 * 1024 * 1024
+DEFAULT_MEMORY_BUDGET_MB = 2048
+DEFAULT_FONT_LINE_HEIGHT = 1.2
+
+
+def pixel_to_hex(pixel, include_alpha):
+    r, g, b, a = pixel
+    if a == 0:
+        return None
+    if include_alpha:
+        return f"#{r:02X}{g:02X}{b:02X}{a:02X}"
+    return f"#{r:02X}{g:02X}{b:02X}"
+
+
+def half_block_cell(top_color, bottom_color, current_mark):
+    if top_color is None and bottom_color is None:
+        return None
+    if bottom_color is None:
+        return None, top_color, "▀"
+    if top_color is None:
+        keep_mark = current_mark == bottom_color and (len(bottom_color) == 7 or bottom_color.endswith("FF"))
+        return (bottom_color if keep_mark else None), bottom_color, "▄"
+    if top_color == bottom_color and current_mark != bottom_color:
+        return None, top_color, "█"
+    return bottom_color, top_color, "▀"
+
+
+def half_block_mark_padding(font_line_height):
+    return f"0,0,{-font_line_height * 50:g},0"
+
+
+def encode_row(data, y, include_alpha, half_block, font_line_height=DEFAULT_FONT_LINE_HEIGHT):
+    height, width = data.shape[:2]
+    mark_padding = half_block_mark_padding(font_line_height)
+    cells = []
+    current_mark = None
+    current_run = None
+    count = 0
+    for x in range(width + 1):
+        cell = None
+        if x < width:
+            top_color = pixel_to_hex(data[y, x], include_alpha)
+            if half_block:
+                bottom_color = pixel_to_hex(data[y + 1, x], include_alpha) if y + 1 < height else None
+                cell = half_block_cell(top_color, bottom_color, current_mark)
+            elif top_color is not None:
+                cell = None, top_color, "█"
+        mark, run = (cell[0], cell[1:]) if cell is not None else (None, None)
+        if cell is not None and mark == current_mark and run == current_run:
+            count += 1
+            continue
+        if current_run is not None:
+            cells.append(f"<color={current_run[0]}>{current_run[1] * count}</color>")
+        if current_mark is not None and mark != current_mark:
+            cells.append("</mark>")
+        if mark is not None and mark != current_mark:
+            cells.append(f"<mark={mark} padding=\"{mark_padding}\">")
+        current_mark = mark
+        current_run = run
+        count = 1 if cell is not None else 0
+    cells.append("\\n")
+    return "".join(cells)
+
+
+def row_cache_path(output_path):
+    return os.path.join(os.path.dirname(output_path), ".rowcache", os.path.basename(output_path) + ".json")
+
+
+def load_row_cache(output_path, settings):
+    cache_path = row_cache_path(output_path)
+    if not os.path.exists(output_path) or not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, "r", encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cache.get("settings") != settings or cache.get("output_size") != os.path.getsize(output_path):
+        return None
+    return cache
+
+
+def remove_row_cache(output_path):
+    cache_path = row_cache_path(output_path)
+    if os.path.exists(cache_path):
+        os.remove(cache_path)
+
+
+def save_row_cache(output_path, settings, row_hashes, row_offsets):
+    cache_path = row_cache_path(output_path)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    cache = {
+        "settings": settings,
+        "output_size": os.path.getsize(output_path),
+        "row_hashes": row_hashes,
+        "row_offsets": row_offsets,
+    }
+    with open(cache_path, "w", encoding='utf-8') as f:
+        json.dump(cache, f)
+
+
+def output_wrappers(output_path, font_size, unity_asset):
+    if not unity_asset:
+        return f"<size={font_size}>", "</size>"
+    name = os.path.splitext(os.path.basename(output_path))[0]
+    header = UNITY_TEXT_ASSET_HEADER.format(name=json.dumps(name, ensure_ascii=False))
+    return header + escape_yaml(f"<size={font_size}>"), escape_yaml("</size>") + "\"\n"
+
+
+def escape_yaml(text):
+    return json.dumps(text, ensure_ascii=False)[1:-1]
+
+
+def encode_output_row(data, y, include_alpha, half_block, unity_asset, font_line_height):
+    encoded_row = encode_row(data, y, include_alpha, half_block, font_line_height)
+    if unity_asset:
+        encoded_row = escape_yaml(encoded_row)
+    return encoded_row.encode("utf-8")
+
+
+def format_file_size(path):
+    output_size = os.path.getsize(path) / (1024 * 1024)
+    return f"{output_size:.2f} MB" if output_size >= 1 else f"{output_size * 1024:.2f} KB"
+
+
+def write_textmeshpro(data, output_path, include_alpha, font_size, half_block, desc, unity_asset=False,
+                      font_line_height=DEFAULT_FONT_LINE_HEIGHT, verbose=True):
+    height, width = data.shape[:2]
+    row_step = 2 if half_block else 1
+    rows = range(0, height, row_step)
+    settings = {"width": width, "height": height, "include_alpha": include_alpha, "font_size": font_size, "half_block": half_block,
+                "font_line_height": font_line_height}
+    row_hashes = [hashlib.blake2b(data[y:y + row_step].tobytes(), digest_size=16).hexdigest() for y in rows]
+
+    cache = load_row_cache(output_path, settings)
+    old_hashes = cache["row_hashes"] if cache else [None] * len(rows)
+    changed = [i for i, row_hash in enumerate(row_hashes) if row_hash != old_hashes[i]]
+    if cache and len(changed) > len(rows) * INCREMENTAL_MAX_CHANGED_RATIO:
+        cache = None
+    if cache and verbose:
+        print(f"\033[94m[INFO] {os.path.basename(output_path)}: {len(rows) - len(changed)} of {len(rows)} rows unchanged, re-encoding {len(changed)} rows\033[0m")
+
+    encoded_rows = {}
+    with tqdm(total=len(rows) if cache is None else len(changed), desc=desc, ncols=100, disable=not verbose) as pbar:
+        if cache is None:
+            remove_row_cache(output_path)
+            header, footer = output_wrappers(output_path, font_size, unity_asset)
+            row_offsets = []
+            with open(output_path, "wb") as f:
+                f.write(header.encode("utf-8"))
+                for y in rows:
+                    row_offsets.append(f.tell())
+                    f.write(encode_output_row(data, y, include_alpha, half_block, unity_asset, font_line_height))
+                    pbar.update(1)
+                row_offsets.append(f.tell())
+                f.write(footer.encode("utf-8"))
+        else:
+            for i in changed:
+                encoded_rows[i] = encode_output_row(data, rows[i], include_alpha, half_block, unity_asset, font_line_height)
+                pbar.update(1)
+
+    if cache is not None:
+        remove_row_cache(output_path)
+        old_offsets = cache["row_offsets"]
+        if all(len(encoded_rows[i]) == old_offsets[i + 1] - old_offsets[i] for i in changed):
+            row_offsets = old_offsets
+            with open(output_path, "r+b") as f:
+                for i in changed:
+                    f.seek(row_offsets[i])
+                    f.write(encoded_rows[i])
+        else:
+            row_offsets = []
+            temp_path = output_path + ".tmp"
+            with open(output_path, "rb") as old_file, open(temp_path, "wb") as f:
+                f.write(old_file.read(old_offsets[0]))
+                for i in range(len(rows)):
+                    row_offsets.append(f.tell())
+                    if i in encoded_rows:
+                        f.write(encoded_rows[i])
                     else:
-                        if current_color is not None:
-                            hex_colors.append(f"<color={current_color}>{'█' * count}</color>")
-                        current_color = hex_color
-                        count = 1
-                else:
-                    if current_color is not None:
-                        hex_colors.append(f"<color={current_color}>{'█' * count}</color>")
-                        current_color = None
-                        count = 0
-            if current_color is not None:
-                hex_colors.append(f"<color={current_color}>{'█' * count}</color>")
-            hex_colors.append("\\n")
-            pbar.update(1)
-    output_content = f"<size={font_size}>" + "".join(hex_colors).replace("\n", "\\n") + "</size>"
-
-    with open(output_path, "w", encoding='utf-8') as f:
-        f.write(output_content)
-
-    output_size = os.path.getsize(output_path) / (1024 * 1024)
-    output_size_str = f"{output_size:.2f} MB" if output_size >= 1 else f"{output_size * 1024:.2f} KB"
+                        old_file.seek(old_offsets[i])
+                        f.write(old_file.read(old_offsets[i + 1] - old_offsets[i]))
+                row_offsets.append(f.tell())
+                old_file.seek(old_offsets[-1])
+                f.write(old_file.read())
+            os.replace(temp_path, output_path)
+
+    save_row_cache(output_path, settings, row_hashes, row_offsets)
+    return format_file_size(output_path)
+
+
+def lod_output_path(output_path, level):
+    if level == 0:
+        return output_path
+    base, ext = os.path.splitext(output_path)
+    return f"{base}_lod{level}{ext}"
+
 
+def count_lod_levels(width, height):
+    levels = 1
+    while width > 1 or height > 1:
+        width, height = (width + 1) // 2, (height + 1) // 2
+        levels += 1
+    return levels
+
+
+def image_to_textmeshpro(image_path, output_path, include_alpha, font_size, half_block=False, lod_levels=1, unity_asset=False,
+                         font_line_height=DEFAULT_FONT_LINE_HEIGHT, verbose=True):
+    img = Image.open(image_path).convert("RGBA")
+    image_name = os.path.basename(image_path)
+
+    max_lod_levels = count_lod_levels(*img.size)
+    if lod_levels > max_lod_levels:
+        if verbose:
+            print(f"\033[93m[WARNING] {image_name} is {img.width}x{img.height} Pix and reaches 1x1 at LOD {max_lod_levels - 1}, writing {max_lod_levels} LOD levels instead of {lod_levels}\033[0m")
+        lod_levels = max_lod_levels
+
+    premultiplied = img.convert("RGBa") if lod_levels > 1 else None
+    results = []
+    for level in range(lod_levels):
+        if level == 0:
+            data = np.array(img)
+        else:
+            premultiplied = premultiplied.reduce(2)
+            data = np.array(premultiplied.convert("RGBA"))
+        level_height, level_width = data.shape[:2]
+        desc = f"[PROGRESS] Converting {image_name}" if level == 0 else f"[PROGRESS] Converting {image_name} LOD {level}"
+        level_path = lod_output_path(output_path, level)
+        output_size_str = write_textmeshpro(data, level_path, include_alpha, font_size, half_block, desc, unity_asset, font_line_height, verbose)
+        results.append((level, level_width, level_height, output_size_str, level_path))
+
+    if not verbose:
+        return results
     print(f"\033[92m[SUCCESS] Conversion successful!\033[0m")
-    print(f"\033[92m[SUCCESS] Output file size: {output_size_str}\033[0m")
-    print(f"\033[92m[SUCCESS] Output file path: {os.path.abspath(output_path)}\033[0m")
+    if lod_levels == 1:
+        print(f"\033[92m[SUCCESS] Output file size: {results[0][3]}\033[0m")
+        print(f"\033[92m[SUCCESS] Output file path: {os.path.abspath(output_path)}\033[0m")
+        return results
+    for level, level_width, level_height, output_size_str, level_path in results:
+        print(f"\033[92m[SUCCESS] LOD {level} (1/{2 ** level}, {level_width}x{level_height} Pix) output file size: {output_size_str} | {os.path.abspath(level_path)}\033[0m")
+
+    return results
 
 
 def parse_font_size(input_size):
@@ -83,14 +303,150 @@ def get_color_mode(image_path):
         return "RGBA" if 'A' in bands else "RGB"
 
 
+def ask_conversion_settings():
+    while True:
+        include_alpha = input(
+            "\033[96m[INPUT] Include alpha channel? (Yes/No): \033[0m").strip().lower()
+        if include_alpha in ['yes', 'y']:
+            include_alpha = True
+            break
+        elif include_alpha in ['no', 'n']:
+            include_alpha = False
+            break
+        else:
+            print("\033[91m[ERROR] Invalid input. Please enter 'Yes' or 'No'.\033[0m")
+
+    while True:
+        half_block = input(
+            "\033[96m[INPUT] Use half-block mode (two pixel rows per text line)? (Yes/No): \033[0m").strip().lower()
+        if half_block in ['yes', 'y']:
+            half_block = True
+            break
+        elif half_block in ['no', 'n']:
+            half_block = False
+            break
+        else:
+            print("\033[91m[ERROR] Invalid input. Please enter 'Yes' or 'No'.\033[0m")
+
+    font_line_height = DEFAULT_FONT_LINE_HEIGHT
+    while half_block:
+        font_line_height = input(f"\033[96m[INPUT] Set the font line height in em, (Ascent Line - Descent Line) / Point Size from the TMP font asset's Face Info (default {DEFAULT_FONT_LINE_HEIGHT}): \033[0m").strip() or str(DEFAULT_FONT_LINE_HEIGHT)
+        try:
+            font_line_height = float(font_line_height)
+        except ValueError:
+            font_line_height = 0
+        if font_line_height > 0:
+            break
+        print("\033[91m[ERROR] Invalid line height. Please enter a positive number.\033[0m")
+
+    while True:
+        font_size = input("\033[96m[INPUT] Set font size (integer/float/percent/fraction, default 1): \033[0m").strip()
+        try:
+            font_size = parse_font_size(font_size)
+            break
+        except ValueError:
+            print("\033[91m[ERROR] Invalid font size format. Please try again.\033[0m")
+
+    while True:
+        lod_levels = input("\033[96m[INPUT] Set LOD levels (1 = original size only, default 1): \033[0m").strip() or '1'
+        try:
+            lod_levels = int(lod_levels)
+        except ValueError:
+            lod_levels = 0
+        if lod_levels >= 1:
+            break
+        print("\033[91m[ERROR] Invalid LOD levels. Please enter an integer of at least 1.\033[0m")
+
+    while True:
+        unity_asset = input(
+            "\033[96m[INPUT] Write a Unity TextAsset (.asset) instead of a .txt file? (Yes/No): \033[0m").strip().lower()
+        if unity_asset in ['yes', 'y']:
+            unity_asset = True
+            break
+        elif unity_asset in ['no', 'n']:
+            unity_asset = False
+            break
+        else:
+            print("\033[91m[ERROR] Invalid input. Please enter 'Yes' or 'No'.\033[0m")
+
+    return include_alpha, half_block, font_size, lod_levels, unity_asset, font_line_height
+
+
+def format_memory(size):
+    return f"{size / (1024 * 1024):.2f} MB"
+
+
+def estimate_job_memory(width, height, lod_levels, half_block, unity_asset):
+    pixel_count = width * height
+    encoded_bytes_per_pixel = HALF_BLOCK_BYTES_PER_PIXEL if half_block else FULL_BLOCK_BYTES_PER_PIXEL
+    if unity_asset:
+        encoded_bytes_per_pixel += UNITY_ASSET_EXTRA_BYTES_PER_PIXEL
+    estimate = WORKER_BASELINE_BYTES + pixel_count * 4 * 3
+    if lod_levels > 1:
+        estimate += pixel_count * 4 * 2
+    estimate += int(pixel_count * encoded_bytes_per_pixel * INCREMENTAL_MAX_CHANGED_RATIO)
+    estimate += height * 256
+    return estimate
+
+
+def run_batch(jobs, memory_budget, conversion_kwargs, max_workers):
+    pending = sorted(jobs, key=lambda job: job[2], reverse=True)
+    running = {}
+    memory_in_use = 0
+    peak_memory = 0
+    peak_concurrency = 0
+    failed = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            for job in list(pending):
+                if len(running) >= max_workers:
+                    break
+                if running and memory_in_use + job[2] > memory_budget:
+                    continue
+                if job[2] > memory_budget:
+                    print(f"\033[93m[WARNING] {os.path.basename(job[0])} needs about {format_memory(job[2])}, more than the memory budget, it will run alone\033[0m")
+                pending.remove(job)
+                try:
+                    future = executor.submit(image_to_textmeshpro, job[0], job[1], verbose=False, **conversion_kwargs)
+                except BrokenProcessPool:
+                    print(f"\033[91m[ERROR] A worker process was terminated unexpectedly (possibly out of memory), not starting: {', '.join(os.path.basename(not_started[0]) for not_started in [job] + pending)}\033[0m")
+                    failed.extend([job] + pending)
+                    pending = []
+                    break
+                running[future] = job
+                memory_in_use += job[2]
+            peak_memory = max(peak_memory, memory_in_use)
+            peak_concurrency = max(peak_concurrency, len(running))
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                job = running.pop(future)
+                memory_in_use -= job[2]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    print(f"\033[91m[ERROR] Image processing failed: {os.path.basename(job[0])}: {e}\033[0m")
+                    failed.append(job)
+                    continue
+                for level, level_width, level_height, output_size_str, level_path in results:
+                    print(f"\033[92m[SUCCESS] {os.path.basename(job[0])}: LOD {level} ({level_width}x{level_height} Pix) output file size: {output_size_str} | {os.path.abspath(level_path)}\033[0m")
+                if len(results) < conversion_kwargs["lod_levels"]:
+                    print(f"\033[93m[WARNING] {os.path.basename(job[0])} reaches 1x1 at LOD {len(results) - 1}, wrote {len(results)} LOD levels instead of {conversion_kwargs['lod_levels']}\033[0m")
+    return peak_concurrency, peak_memory, failed
+
+
 def show_example_usage():
     print("=" * 100)
 
     print("\033[94m[INFO] Basic Operations:\033[0m")
-    print("1. Choose input image (supports PNG, JPG, JPEG, etc.)")
+    print("1. Choose input image (supports PNG, JPG, JPEG, etc.), or several numbers separated by commas / 'all' for batch conversion")
     print("2. Choose whether to include alpha channel")
-    print("3. Set font size, supports integers, floats, percentages, fractions")
-    print("4. Convert to TMP rich text labels")
+    print("3. Choose whether to use half-block mode (two pixel rows per text line, smaller output where the lower pixel row repeats its colors)")
+    print("   Half-block mode also asks for the font line height, read it from the TMP font asset's Face Info")
+    print("4. Set font size, supports integers, floats, percentages, fractions")
+    print("5. Set LOD levels, each extra level is also written at half the previous resolution")
+    print("6. Choose whether to write a Unity TextAsset (.asset) instead of a .txt file")
+    print("7. Convert to TMP rich text labels")
 
     print("\033[94m[INFO] Font size examples:\033[0m")
     print("Font size can be:")
@@ -99,6 +455,14 @@ def show_example_usage():
     print(" - Percentage (e.g., 50%)")
     print(" - Fraction (e.g., 2/3)")
 
+    print("\033[94m[INFO] Half-block mode font line height:\033[0m")
+    print("The bottom pixel is a <mark> that TMP draws over the glyphs, from the font's descent line to its ascent line.")
+    print("Its top padding is set to minus half the line height so it only covers the lower half of the line.")
+    print(" - Line height = (Ascent Line - Descent Line) / Point Size, from the Face Info of the TMP font asset")
+    print(f" - Most fonts are around 1.1 to 1.2, the default is {DEFAULT_FONT_LINE_HEIGHT}")
+    print(" - The font's block glyphs (█ ▀ ▄) are assumed to fill the line from descent to ascent")
+    print(" - Too small a value lets the mark cover the top pixel, too large a value leaves a gap between the two")
+
     print("\033[94m[INFO] Example of TMP rich text labels after conversion:\033[0m")
     example_text = """
     - Without alpha channel
@@ -106,6 +470,9 @@ def show_example_usage():
 
     - With alpha channel
     <size=1><color=#FF0000FF>█████</color><color=#00FF0080>████████</color><color=#0000FF00>██████████</color></size>
+
+    - Half-block mode, line height 1.2 (top pixel is the text color, bottom pixel is a mark covering the lower half)
+    <size=1><mark=#0000FF padding="0,0,-60,0"><color=#FF0000>▀▀▀▀▀</color><color=#FFFF00>▀▀▀</color></mark><color=#00FF00>▄▄▄▄</color><color=#FFFFFF>████</color></size>
     """
     print(example_text)
 
@@ -113,6 +480,8 @@ def show_example_usage():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
+
     print("\033[97m[WELCOME] Welcome to the Image to TMP Rich Text Tag tool!\033[0m")
     print("\033[97m[WELCOME] This tool can convert images to TMP rich text tags suitable for Unity engine!\033[0m")
     print("\033[97m[WELCOME] Author: www.bilibili.com@是闪闪闪闪闪\033[0m")
@@ -171,7 +540,7 @@ if __name__ == "__main__":
             print_dynamic_line(100)
 
             while True:
-                user_input = input("\033[96m[INPUT] Enter the image number to select or '0' to exit: \033[0m")
+                user_input = input("\033[96m[INPUT] Enter the image number to select, several numbers separated by commas or 'all' for batch conversion, or '0' to exit: \033[0m")
                 if user_input == '0':
                     print("\033[92m[SUCCESS] Process exited.\033[0m")
                     print("The window will close in 5 seconds...")
@@ -179,6 +548,66 @@ if __name__ == "__main__":
                     sys.exit()
 
                 try:
+                    if user_input.strip().lower() == 'all' or ',' in user_input:
+                        if user_input.strip().lower() == 'all':
+                            choices = list(range(len(images)))
+                        else:
+                            choices = sorted({int(part) - 1 for part in user_input.split(',') if part.strip()})
+                        if not choices or not all(0 <= choice < len(images) for choice in choices):
+                            print("\033[91m[ERROR] Invalid input. Please enter a valid image number!\033[0m")
+                            continue
+
+                        try:
+                            include_alpha, half_block, font_size, lod_levels, unity_asset, font_line_height = ask_conversion_settings()
+
+                            while True:
+                                memory_budget = input(f"\033[96m[INPUT] Set memory budget for batch conversion in MB (default {DEFAULT_MEMORY_BUDGET_MB}): \033[0m").strip() or str(DEFAULT_MEMORY_BUDGET_MB)
+                                try:
+                                    memory_budget = int(memory_budget)
+                                except ValueError:
+                                    memory_budget = 0
+                                if memory_budget > 0:
+                                    memory_budget *= 1024 * 1024
+                                    break
+                                print("\033[91m[ERROR] Invalid memory budget. Please enter a positive integer.\033[0m")
+
+                            jobs = []
+                            output_owners = {}
+                            for choice in choices:
+                                selected_image = os.path.join(input_folder, images[choice])
+                                img_width, img_height = Image.open(selected_image).size
+                                output_file_name = f"{os.path.splitext(images[choice])[0]}{'.asset' if unity_asset else '.txt'}"
+                                output_path = os.path.join(output_folder, output_file_name)
+                                job_outputs = [os.path.normcase(lod_output_path(output_path, level))
+                                               for level in range(min(lod_levels, count_lod_levels(img_width, img_height)))]
+                                conflict = next((output_owners[path] for path in job_outputs if path in output_owners), None)
+                                if conflict is not None:
+                                    print(f"\033[91m[ERROR] {images[choice]} would overwrite the output of {conflict}, skipping it. Rename one of them to convert both.\033[0m")
+                                    continue
+                                output_owners.update((path, images[choice]) for path in job_outputs)
+                                jobs.append((selected_image, output_path, estimate_job_memory(img_width, img_height, lod_levels, half_block, unity_asset)))
+
+                            max_workers = min(os.cpu_count() or 1, len(jobs), max(1, memory_budget // WORKER_BASELINE_BYTES))
+                            print(f"\033[94m[INFO] Converting {len(jobs)} images with up to {max_workers} workers, largest first (estimated memory: {', '.join(f'{os.path.basename(job[0])} {format_memory(job[2])}' for job in jobs)})\033[0m")
+                            start_time = time.time()
+                            conversion_kwargs = {"include_alpha": include_alpha, "font_size": font_size, "half_block": half_block,
+                                                 "lod_levels": lod_levels, "unity_asset": unity_asset, "font_line_height": font_line_height}
+                            peak_concurrency, peak_memory, failed = run_batch(jobs, memory_budget, conversion_kwargs, max_workers)
+                            print(f"\033[92m[SUCCESS] Batch conversion finished: {len(jobs) - len(failed)} of {len(choices)} images converted in {time.time() - start_time:.2f} s\033[0m")
+                            print(f"\033[92m[SUCCESS] Peak concurrency: {peak_concurrency} of {max_workers} workers | Peak estimated memory: {format_memory(peak_memory)} of {format_memory(memory_budget)} budget\033[0m")
+
+                        except Exception as e:
+                            print(f"\033[91m[ERROR] Image processing failed: {e}\033[0m")
+
+                        continue_conversion = input(
+                            "\033[96m[INPUT] Continue converting other images? (Yes/No): \033[0m").strip().lower()
+                        if continue_conversion not in ['yes', 'y']:
+                            print("\033[92m[SUCCESS] Process exited.\033[0m")
+                            print("The window will close in 5 seconds...")
+                            time.sleep(5)
+                            sys.exit()
+                        break
+
                     choice = int(user_input) - 1
                     if 0 <= choice < len(images):
                         selected_image = os.path.join(input_folder, images[choice])
@@ -200,29 +629,11 @@ if __name__ == "__main__":
                                 if confirm not in ['yes', 'y']:
                                     continue
 
-                            while True:
-                                include_alpha = input(
-                                    "\033[96m[INPUT] Include alpha channel? (Yes/No): \033[0m").strip().lower()
-                                if include_alpha in ['yes', 'y']:
-                                    include_alpha = True
-                                    break
-                                elif include_alpha in ['no', 'n']:
-                                    include_alpha = False
-                                    break
-                                else:
-                                    print("\033[91m[ERROR] Invalid input. Please enter 'Yes' or 'No'.\033[0m")
-
-                            while True:
-                                font_size = input("\033[96m[INPUT] Set font size (integer/float/percent/fraction, default 1): \033[0m").strip()
-                                try:
-                                    font_size = parse_font_size(font_size)
-                                    break
-                                except ValueError:
-                                    print("\033[91m[ERROR] Invalid font size format. Please try again.\033[0m")
+                            include_alpha, half_block, font_size, lod_levels, unity_asset, font_line_height = ask_conversion_settings()
 
-                            output_file_name = f"{os.path.splitext(images[choice])[0]}.txt"
+                            output_file_name = f"{os.path.splitext(images[choice])[0]}{'.asset' if unity_asset else '.txt'}"
                             output_path = os.path.join(output_folder, output_file_name)
-                            image_to_textmeshpro(selected_image, output_path, include_alpha, font_size)
+                            image_to_textmeshpro(selected_image, output_path, include_alpha, font_size, half_block, lod_levels, unity_asset, font_line_height)
 
                         except Exception as e:
                             print(f"\033[91m[ERROR] Image processing failed: {e}\033[0m")